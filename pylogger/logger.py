@@ -13,7 +13,14 @@ from config_manager.env_var import EnvVar
 from pylogger import log_levels
 from pylogger.handlers.file_handler import file_handler
 from pylogger.handlers.gcp_handler import get_gcp_handler
-from utils import dates, function_execution_timer, hardware_metrics
+from utils import bounded_json, dates, function_execution_timer, hardware_metrics
+
+
+def _get_extra_args_limit(env_var_name: str, default_value: str) -> int:
+    value = str(EnvVar(env_var_name, default_value)).strip()
+    if not value.isdecimal() or int(value) < 1:
+        raise ValueError(f"{env_var_name} must be a positive integer, got {value!r}")
+    return int(value)
 
 
 class Logger:
@@ -57,6 +64,14 @@ class Logger:
         ],
     }
     _BEAUTIFY_JSON_LOGS = strtobool(str(EnvVar("BEAUTIFY_JSON_LOGS", "False")))
+    _EXTRA_ARGS_LIMITS = {
+        "max_bytes": _get_extra_args_limit("EXTRA_ARGS_MAX_BYTES", "65536"),
+        "max_depth": _get_extra_args_limit("EXTRA_ARGS_MAX_DEPTH", "10"),
+        "max_items": _get_extra_args_limit("EXTRA_ARGS_MAX_ITEMS", "100"),
+        "max_string_length": _get_extra_args_limit(
+            "EXTRA_ARGS_MAX_STRING_LENGTH", "1024"
+        ),
+    }
 
     loguru.logger.configure(**_LOGURU_CONFIG)
 
@@ -104,7 +119,9 @@ class Logger:
     def info(message: str, extra_args: dict = {}) -> None:
         log = Logger._get_base_log("custom_message", log_levels.INFO)
         log["message"] = message
-        log["data"] = {"extra_args": extra_args}
+        log["data"] = {
+            "extra_args": bounded_json.bound(extra_args, **Logger._EXTRA_ARGS_LIMITS)
+        }
         Logger._log(log)
 
     @staticmethod
@@ -4,7 +4,14 @@ from datetime import timedelta
 
 import pytest
 
-from pylogger.logger import Logger, dates, function_execution_timer, loguru, traceback
+from pylogger.logger import (
+    Logger,
+    _get_extra_args_limit,
+    dates,
+    function_execution_timer,
+    loguru,
+    traceback,
+)
 from utils import hardware_metrics
 
 last_log = None
@@ -167,3 +174,74 @@ def test_log_critial_error():
         "exc_info": "test stack trace",
         "message": "test critical error exception",
     }
+
+
+def test_log_info_truncates_large_extra_args():
+    Logger.info(
+        "test info message",
+        {"numbers": list(range(100_000)), "text": "x" * 100_000},
+    )
+    extra_args = last_log["json_log"]["data"]["extra_args"]
+    assert extra_args["numbers"][:3] == [0, 1, 2]
+    assert extra_args["numbers"][-1] == "<truncated> 99900 more items"
+    assert len(extra_args["numbers"]) == 101
+    assert extra_args["text"] == "x" * 1024 + "...<truncated> 98976 chars"
+
+
+def test_log_info_truncates_deep_extra_args():
+    nested = {}
+    current = nested
+    for _ in range(50):
+        current["child"] = {}
+        current = current["child"]
+
+    Logger.info("test info message", nested)
+    extra_args = last_log["json_log"]["data"]["extra_args"]
+    for _ in range(9):
+        extra_args = extra_args["child"]
+    assert extra_args["child"] == "<truncated> max depth reached"
+
+
+def test_log_info_bounds_total_extra_args_size():
+    Logger.info("test info message", {str(i): "y" * 1000 for i in range(100)})
+    extra_args = last_log["json_log"]["data"]["extra_args"]
+    assert len(json.dumps(extra_args)) < 66 * 1024
+    assert extra_args["<truncated>"].endswith("more keys")
+
+
+def test_log_info_handles_non_serializable_extra_args():
+    class NotSerializable:
+        def __repr__(self):
+            raise AssertionError("the repr of unknown objects must not be called")
+
+    Logger.info(
+        "test info message",
+        {"object": NotSerializable(), "tags": {"a"}, 1: None},
+    )
+    extra_args = last_log["json_log"]["data"]["extra_args"]
+    assert extra_args.pop("object").startswith(
+        "<test_log_info_handles_non_serializable_extra_args.<locals>.NotSerializable"
+        " object at 0x"
+    )
+    assert extra_args == {"tags": ["a"], "1": None}
+
+
+def test_log_info_handles_huge_ints_in_extra_args():
+    Logger.info("test info message", {"n": 10**5000})
+    assert last_log["json_log"]["data"]["extra_args"] == {
+        "n": "<truncated> int with about 5002 digits"
+    }
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-5", "1.5"])
+def test_get_extra_args_limit_rejects_invalid_values(value):
+    os.environ["EXTRA_ARGS_MAX_ITEMS"] = value
+    try:
+        with pytest.raises(ValueError, match="EXTRA_ARGS_MAX_ITEMS must be a positive"):
+            _get_extra_args_limit("EXTRA_ARGS_MAX_ITEMS", "100")
+    finally:
+        del os.environ["EXTRA_ARGS_MAX_ITEMS"]
+
+
+def test_get_extra_args_limit_defaults():
+    assert _get_extra_args_limit("EXTRA_ARGS_MAX_ITEMS", "100") == 100
@@ -0,0 +1,166 @@
+import json
+import tracemalloc
+from collections import abc, deque
+from dataclasses import dataclass, field
+from datetime import date
+
+import pytest
+
+from utils.bounded_json import MAX_DEPTH_CEILING, bound
+
+
+def _peak_memory_of(function, *args, **kwargs) -> int:
+    tracemalloc.start()
+    try:
+        function(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class TestBound:
+    # Tests that large bytes are sliced before being represented
+    def test_large_bytes_use_bounded_memory(self):
+        payload = {"x": bytearray(10_000_000)}
+        assert _peak_memory_of(bound, payload) < 1_000_000
+        result = bound(payload, max_string_length=20)
+        assert result["x"] == "bytearray(b'\\x00\\x00...<truncated> 78 chars"
+
+    # Tests that the repr of unknown objects is never built
+    def test_unknown_objects_use_bounded_memory(self):
+        @dataclass
+        class Payload:
+            rows: list = field(default_factory=lambda: list(range(3_000_000)))
+
+        payload = {"p": Payload(), "d": date(2023, 1, 1)}
+        assert _peak_memory_of(bound, payload) < 1_000_000
+        result = bound(payload)
+        assert result["p"].startswith(
+            "<TestBound.test_unknown_objects_use_bounded_memory.<locals>.Payload"
+            " object at 0x"
+        )
+        assert result["d"] == "datetime.date(2023, 1, 1)"
+
+    # Tests that sized iterables and mapping views are walked lazily
+    def test_large_iterables_are_walked_lazily(self):
+        numbers = deque(range(2_000_000))
+        mapping = dict.fromkeys(range(2_000_000))
+        for payload in (numbers, mapping.keys(), mapping.values()):
+            assert _peak_memory_of(bound, payload) < 1_000_000
+        assert bound(numbers, max_items=2) == [0, 1, "<truncated> 1999998 more items"]
+        assert bound(mapping.values(), max_items=1) == [
+            None,
+            "<truncated> 1999999 more items",
+        ]
+
+    # Tests that iterables whose len doesn't count what they iterate over are not walked
+    def test_iterables_with_mismatched_len(self):
+        class FrameLike:
+            columns = ["a", "b"]
+
+            def __len__(self):
+                return 1_000_000
+
+            def __iter__(self):
+                return iter(self.columns)
+
+        result = bound({"frame": FrameLike()})
+        assert "FrameLike object at 0x" in result["frame"]
+
+    # Tests that the byte budget is respected when it is almost exhausted
+    def test_tiny_byte_budget(self):
+        assert bound(["a" * 100, "b", "c"], max_bytes=3) == [
+            "a...<truncated> 99 chars",
+            "<truncated> 2 more items",
+        ]
+        assert bound({"a": 1}, max_bytes=2) == {
+            "<truncated>": "<truncated> 1 more keys"
+        }
+
+    # Tests that strings are truncated by their escaped length
+    def test_escaped_strings_respect_byte_budget(self):
+        result = bound(["\x00" * 1024] * 100, max_bytes=1000)
+        assert len(json.dumps(result, separators=(",", ":"))) < 1100
+        assert result[0] == "\x00" * 166 + "...<truncated> 858 chars"
+        assert bound(["\U0001F600" * 10], max_bytes=30)[0].startswith(
+            "\U0001F600\U0001F600..."
+        )
+
+    # Tests that objects without a usable repr do not raise
+    def test_unrepresentable_objects(self):
+        class BrokenIterable(abc.Sequence):
+            def __getitem__(self, index):
+                raise ValueError("broken")
+
+            def __len__(self):
+                return 1
+
+        result = bound(
+            {"generator": (i for i in range(3)), "iterable": BrokenIterable()}
+        )
+        assert result["generator"].startswith("<generator object")
+        assert "BrokenIterable object" in result["iterable"]
+        json.dumps(result)
+
+    # Tests that huge ints are replaced by a marker instead of raising
+    def test_huge_ints(self):
+        result = bound(
+            {"small": 10**20, "huge": 10**5000, "negative": -(10**5000)}
+        )
+        assert result == {
+            "small": 10**20,
+            "huge": "<truncated> int with about 5002 digits",
+            "negative": "<truncated> int with about 5002 digits",
+        }
+        json.dumps(result)
+
+    # Tests that keys are converted to str the way json does
+    def test_key_conversion(self):
+        keys = {None: 1, True: 2, False: 3, 1.5: 4, 10**5000: 5, (1, 2): 6}
+        assert bound(keys) == {
+            "null": 1,
+            "true": 2,
+            "false": 3,
+            "1.5": 4,
+            "<truncated> int with about 5002 digits": 5,
+            "(1, 2)": 6,
+        }
+        assert bound({None: 1, True: 2, 1.5: 3}) == json.loads(
+            json.dumps({None: 1, True: 2, 1.5: 3})
+        )
+
+    # Tests that keys colliding once converted to str are all kept
+    def test_colliding_keys(self):
+        assert bound({1: "a", "1": "b"}) == {"1": "a", "1 (2)": "b"}
+        assert bound({"<truncated>": 1, "a": 2, "b": 3}, max_items=2) == {
+            "<truncated>": 1,
+            "a": 2,
+            "<truncated> (2)": "<truncated> 1 more keys",
+        }
+
+    # Tests that empty containers at the depth limit are not marked as truncated
+    def test_empty_containers_at_max_depth(self):
+        assert bound({"a": [], "b": {}, "c": [1]}, max_depth=1) == {
+            "a": [],
+            "b": {},
+            "c": "<truncated> max depth reached",
+        }
+
+    # Tests that limits lower than 1 are rejected
+    @pytest.mark.parametrize(
+        "limit", ["max_bytes", "max_depth", "max_items", "max_string_length"]
+    )
+    def test_invalid_limits(self, limit):
+        with pytest.raises(ValueError, match=f"{limit} must be at least 1, got 0"):
+            bound({}, **{limit: 0})
+
+    # Tests that a huge max_depth is clamped instead of hitting the recursion limit
+    def test_max_depth_is_clamped(self):
+        nested = []
+        for _ in range(10_000):
+            nested = [nested]
+
+        result = bound(nested, max_depth=10**6)
+        for _ in range(MAX_DEPTH_CEILING):
+            result = result[0]
+        assert result == "<truncated> max depth reached"
@@ -0,0 +1,275 @@
+import json
+import math
+import pathlib
+import reprlib
+import sys
+import uuid
+from collections import abc
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional
+
+TRUNCATED_MARKER = "<truncated>"
+# Keeps the recursion of the encoder well below the interpreter limit
+MAX_DEPTH_CEILING = 100
+# Exact types whose builtin repr is known to be small and cheap to build
+_CHEAP_REPR_TYPES = {
+    complex,
+    range,
+    date,
+    datetime,
+    time,
+    timedelta,
+    timezone,
+    uuid.UUID,
+    type(pathlib.PurePath()),
+    type(pathlib.Path()),
+}
+
+# Sequences (including deques), sets, mappings and their views
+_WALKABLE_TYPES = (abc.Sequence, abc.Set, abc.Mapping, abc.MappingView)
+
+
+class _CappedRepr(reprlib.Repr):
+    """reprlib.Repr falls back to the builtin repr for any type it doesn't know,
+    which renders the whole object before truncating it. Bytes and bytearray
+    are sliced first and the string limit of the encoder marks the truncation,
+    while the repr of other unknown types is only trusted for a few types."""
+
+    def repr_instance(self, obj: Any, level: int) -> str:
+        if type(obj) in _CHEAP_REPR_TYPES:
+            return super().repr_instance(obj, level)
+        return f"<{type(obj).__qualname__} object at {id(obj):#x}>"
+
+    def repr_bytes(self, obj: bytes, level: int) -> str:
+        return self._repr_sliced(obj)
+
+    def repr_bytearray(self, obj: bytearray, level: int) -> str:
+        return self._repr_sliced(obj)
+
+    def _repr_sliced(self, obj: Any) -> str:
+        return repr(obj[: self.maxstring + 1])
+
+
+class _BoundedEncoder:
+    """Walks an object incrementally and builds a JSON-serializable copy of it
+    that respects the given size limits. Containers are consumed lazily so the
+    work done is proportional to the limits, not to the size of the input.
+
+    Attributes:
+        remaining_bytes: int
+            Estimated number of bytes still available for the compact JSON encoding.
+        max_depth: int
+            Maximum nesting level of lists and dicts.
+        max_items: int
+            Maximum number of items kept from any sequence, set or mapping.
+        max_string_length: int
+            Maximum number of characters kept from any string.
+    """
+
+    def __init__(
+        self, max_bytes: int, max_depth: int, max_items: int, max_string_length: int
+    ):
+        self.remaining_bytes = max_bytes
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_string_length = max_string_length
+        self._repr = _CappedRepr()
+        self._repr.maxlevel = max_depth
+        self._repr.maxstring = self._repr.maxother = max_string_length
+        self._repr.maxlong = max_string_length
+        for attribute in (
+            "maxdict",
+            "maxlist",
+            "maxtuple",
+            "maxset",
+            "maxfrozenset",
+            "maxdeque",
+            "maxarray",
+        ):
+            setattr(self._repr, attribute, max_items)
+
+    def encode(self, obj: Any, depth: int = 0) -> Any:
+        if isinstance(obj, int) and not isinstance(obj, bool):
+            return self._encode_int(obj)
+        if obj is None or isinstance(obj, (bool, float)):
+            return self._encode_scalar(obj)
+        if isinstance(obj, str):
+            return self._encode_string(obj)
+        size = self._get_walkable_size(obj)
+        if size is None:
+            return self._encode_string(self._safe_repr(obj))
+        if depth >= self.max_depth and size > 0:
+            return self._encode_marker("max depth reached")
+        try:
+            if isinstance(obj, abc.Mapping):
+                return self._encode_dict(obj, size, depth)
+            return self._encode_list(obj, size, depth)
+        except Exception:
+            return self._encode_string(self._safe_repr(obj))
+
+    def _encode_scalar(self, value: Any) -> Any:
+        self.remaining_bytes -= len(json.dumps(value))
+        return value
+
+    def _encode_int(self, value: int) -> Any:
+        huge_int_marker = self._get_huge_int_marker(value)
+        if huge_int_marker is not None:
+            return self._encode_scalar(huge_int_marker)
+        return self._encode_scalar(int(value))
+
+    def _get_huge_int_marker(self, value: int) -> Optional[str]:
+        """Converting huge ints to str is slow and raises past the interpreter
+        limit, so their size is estimated from bit_length instead."""
+        digits = math.ceil(value.bit_length() * math.log10(2)) + 1
+        max_digits = self.max_string_length
+        if sys.get_int_max_str_digits():
+            max_digits = min(max_digits, sys.get_int_max_str_digits())
+        if digits > max_digits:
+            return f"{TRUNCATED_MARKER} int with about {digits} digits"
+        return None
+
+    def _encode_string(self, value: str) -> str:
+        limit = self._get_fitting_length(value[: self.max_string_length])
+        if len(value) > limit:
+            value = f"{value[:limit]}...{TRUNCATED_MARKER} {len(value) - limit} chars"
+        self.remaining_bytes -= len(json.dumps(value))
+        return value
+
+    def _get_fitting_length(self, value: str) -> int:
+        """Returns the length of the longest prefix of value whose escaped JSON
+        encoding fits in the remaining byte budget."""
+        if self._get_escaped_length(value) <= self.remaining_bytes:
+            return len(value)
+        fitting, too_long = 0, len(value)
+        while too_long - fitting > 1:
+            middle = (fitting + too_long) // 2
+            if self._get_escaped_length(value[:middle]) <= self.remaining_bytes:
+                fitting = middle
+            else:
+                too_long = middle
+        return fitting
+
+    def _get_escaped_length(self, value: str) -> int:
+        return len(json.dumps(value)) - 2  # quotes
+
+    def _encode_marker(self, reason: str) -> str:
+        """Markers are always kept, even when the byte budget is exhausted."""
+        return self._encode_scalar(f"{TRUNCATED_MARKER} {reason}")
+
+    def _encode_list(self, obj: Iterable, size: int, depth: int) -> List[Any]:
+        self.remaining_bytes -= 2  # brackets
+        result = list()
+        for item in self._take(obj, size):
+            result.append(self.encode(item, depth + 1))
+            self.remaining_bytes -= 1  # separator
+        skipped = size - len(result)
+        if skipped > 0:
+            result.append(self._encode_marker(f"{skipped} more items"))
+        return result
+
+    def _encode_dict(self, obj: abc.Mapping, size: int, depth: int) -> dict:
+        self.remaining_bytes -= 2  # braces
+        result = dict()
+        consumed = 0
+        for key, value in self._take(obj.items(), size):
+            consumed += 1
+            key = self._encode_string(self._convert_key(key))
+            encoded_key = self._get_unique_key(result, key)
+            result[encoded_key] = self.encode(value, depth + 1)
+            self.remaining_bytes -= 2  # colon and separator
+        if size > consumed:
+            marker_key = self._get_unique_key(result, TRUNCATED_MARKER)
+            result[marker_key] = self._encode_marker(f"{size - consumed} more keys")
+        return result
+
+    def _convert_key(self, key: Any) -> str:
+        """Converts keys to str the way json does, falling back to the capped
+        repr only for the key types json rejects."""
+        if isinstance(key, str):
+            return key
+        if isinstance(key, int) and not isinstance(key, bool):
+            huge_int_marker = self._get_huge_int_marker(key)
+            return huge_int_marker if huge_int_marker is not None else str(int(key))
+        if key is None or isinstance(key, (bool, float)):
+            return json.dumps(key)
+        return self._safe_repr(key)
+
+    def _get_unique_key(self, result: dict, key: str) -> str:
+        """Adds a numeric suffix to keys that collide once converted to str or
+        truncated, so that no value already in result is overwritten."""
+        unique_key, suffix = key, 1
+        while unique_key in result:
+            suffix += 1
+            unique_key = f"{key} ({suffix})"
+        self.remaining_bytes -= len(unique_key) - len(key)
+        return unique_key
+
+    def _take(self, items: Iterable, size: int) -> Iterator[Any]:
+        """Yields items while both the item limit and the byte budget allow it."""
+        for item in islice(items, min(size, self.max_items)):
+            if self.remaining_bytes <= 0:
+                return
+            yield item
+
+    def _get_walkable_size(self, obj: Any) -> Optional[int]:
+        """Returns the size of the containers that can be walked lazily item by
+        item, or None for the objects that should be represented by their repr.
+        Only the types whose len counts the items they iterate over are walked,
+        which is not the case of a DataFrame for instance."""
+        if isinstance(obj, (bytes, bytearray, memoryview)):
+            return None
+        if not isinstance(obj, _WALKABLE_TYPES):
+            return None
+        try:
+            return len(obj)
+        except Exception:
+            return None
+
+    def _safe_repr(self, obj: Any) -> str:
+        try:
+            return self._repr.repr(obj)
+        except Exception:
+            return f"<unrepresentable {obj.__class__.__name__}>"
+
+
+def bound(
+    obj: Any,
+    max_bytes: int = 65536,
+    max_depth: int = 10,
+    max_items: int = 100,
+    max_string_length: int = 1024,
+) -> Any:
+    """
+    Returns a JSON-serializable copy of obj whose compact JSON encoding stays
+    close to max_bytes. Anything over the limits is dropped and replaced by a
+    marker starting with TRUNCATED_MARKER. Sequences, sets and mappings are
+    walked lazily, and any other object json cannot encode is replaced by its
+    type name, or its repr for a few types known to be cheap, instead of raising.
+
+    Args:
+        obj: The object to bound.
+        max_bytes: Approximate size budget of the compact JSON encoding.
+        max_depth: Maximum nesting level of lists and dicts, clamped to MAX_DEPTH_CEILING.
+        max_items: Maximum number of items kept from any sequence, set or mapping.
+        max_string_length: Maximum number of characters kept from any string.
+
+    Returns:
+        The bounded, JSON-serializable copy of obj.
+
+    Raises:
+        ValueError: If any of the limits is lower than 1.
+    """
+    limits = {
+        "max_bytes": max_bytes,
+        "max_depth": max_depth,
+        "max_items": max_items,
+        "max_string_length": max_string_length,
+    }
+    for name, value in limits.items():
+        if value < 1:
+            raise ValueError(f"{name} must be at least 1, got {value}")
+
+    max_depth = min(max_depth, MAX_DEPTH_CEILING)
+    encoder = _BoundedEncoder(max_bytes, max_depth, max_items, max_string_length)
+    return encoder.encode(obj)